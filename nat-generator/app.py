@@ -1,42 +1,40 @@
 #!/usr/bin/env python3
 import streamlit as st
-import ipaddress
-import io
+import math
+from nat_core import build_csv, format_slice, generate_nat_mapping
 
-def generate_nat_mapping(dmz_range, internal_range):
-    """Generate 1:1 NAT mapping between two IP ranges"""
-    try:
-        # Create networks
-        dmz_network = ipaddress.ip_network(dmz_range, strict=False)
-        internal_network = ipaddress.ip_network(internal_range, strict=False)
-        
-        # Check that masks are identical
-        if dmz_network.prefixlen != internal_network.prefixlen:
-            return None, f"❌ ERROR: Subnet masks must be identical! DMZ: /{dmz_network.prefixlen}, Internal: /{internal_network.prefixlen}"
-        
-        # Generate IP lists
-        dmz_ips = list(dmz_network.hosts())
-        internal_ips = list(internal_network.hosts())
-        
-        # If no hosts (small network), take all addresses
-        if not dmz_ips:
-            dmz_ips = list(dmz_network)
-            internal_ips = list(internal_network)
-        
-        # Create mapping
-        mappings = []
-        for dmz_ip, internal_ip in zip(dmz_ips, internal_ips):
-            mappings.append({
-                'DMZ_IP': str(dmz_ip),
-                'Internal_IP': str(internal_ip)
-            })
-        
-        return mappings, None
-        
-    except ValueError as e:
-        return None, f"❌ ERROR: Invalid IP format - {e}"
-    except Exception as e:
-        return None, f"❌ ERROR: {e}"
+# Rows sent to the browser per table page
+PAGE_SIZE = 1000
+
+# Static page content, built once per process rather than on every rerun
+_HEADER_HTML = """
+<div style='text-align: center; margin-bottom: 30px; padding: 10px; background-color: #f0f2f6; border-radius: 10px;'>
+    <p style='margin: 0; color: #666;'>Created by <strong>Sofiane Kerbel</strong></p>
+    <p style='margin: 5px 0 0 0;'><a href='https://www.linkedin.com/in/sofiane-kerbel' target='_blank'>🔗 LinkedIn Profile</a></p>
+</div>
+"""
+
+_FOOTER_HTML = """
+<div style='text-align: center; margin-top: 30px; color: #888;'>
+    <p>🛠️ Built by <strong><a href='https://www.linkedin.com/in/sofiane-kerbel' target='_blank'>Sofiane Kerbel</a></strong></p>
+    <p style='font-size: 12px;'>Network Administration Tool | 1:1 NAT Mapping Generator</p>
+</div>
+"""
+
+_EXAMPLES = (
+    "**Small (/30)**\n"
+    "- DMZ: 192.168.1.0/30\n"
+    "- Internal: 10.0.1.0/30\n"
+    "- IPs: 2 addresses",
+    "**Medium (/26)**\n"
+    "- DMZ: 192.168.1.0/26\n"
+    "- Internal: 10.188.65.0/26\n"
+    "- IPs: 62 addresses",
+    "**Large (/24)**\n"
+    "- DMZ: 192.168.1.0/24\n"
+    "- Internal: 10.0.1.0/24\n"
+    "- IPs: 254 addresses",
+)
 
 def main():
     # Page configuration
@@ -51,15 +49,7 @@ def main():
     st.markdown("---")
     
     # Creator information
-    st.markdown(
-        """
-        <div style='text-align: center; margin-bottom: 30px; padding: 10px; background-color: #f0f2f6; border-radius: 10px;'>
-            <p style='margin: 0; color: #666;'>Created by <strong>Sofiane Kerbel</strong></p>
-            <p style='margin: 5px 0 0 0;'><a href='https://www.linkedin.com/in/sofiane-kerbel' target='_blank'>🔗 LinkedIn Profile</a></p>
-        </div>
-        """, 
-        unsafe_allow_html=True
-    )
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     # Main layout - Configuration full width
     st.header("📍 IP Range Configuration")
@@ -80,120 +70,111 @@ def main():
             help="Format: IP/mask (e.g., 10.188.65.0/26)"
         )
         
-        generate_button = st.button("🚀 Generate Mapping", type="primary", use_container_width=True)
-    
-    # Info message when no generation has been done (outside columns, full width)
-    if not generate_button:
-        st.info("👆 Configure your IP ranges above and click 'Generate Mapping' to start")
+        generate_button = st.button("🚀 Generate Mapping", type="primary", width="stretch")
     
-    # Results section (full width)
+    # Generate on click and keep the result so pagination reruns can reuse it
     if generate_button:
         if dmz_range and internal_range:
             with st.spinner("Generating mapping..."):
-                mappings, error = generate_nat_mapping(dmz_range, internal_range)
+                mappings, dmz_net, int_net, error = generate_nat_mapping(dmz_range, internal_range)
             
             if error:
+                st.session_state.pop('dmz_u32', None)
                 st.error(error)
             else:
-                # Display statistics
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("📊 Total Mappings", len(mappings))
-                with col2:
-                    st.metric("🌐 DMZ Range", dmz_range)
-                with col3:
-                    st.metric("🏠 Internal Range", internal_range)
-                
-                st.markdown("---")
-                
-                # Display table
-                st.subheader("✅ 1:1 NAT MAPPING")
-                
-                # Streamlit can display list of dicts directly
-                st.dataframe(
-                    mappings,
-                    use_container_width=True,
-                    hide_index=True
-                )
-                
-                # CSV download button - create CSV manually
-                csv_lines = ["DMZ_IP,Internal_IP"]
-                for mapping in mappings:
-                    csv_lines.append(f"{mapping['DMZ_IP']},{mapping['Internal_IP']}")
-                csv_data = "\n".join(csv_lines)
-                
-                st.download_button(
-                    label="💾 Download as CSV",
-                    data=csv_data,
-                    file_name="nat_mapping.csv",
-                    mime="text/csv",
-                    type="secondary"
-                )
-                
-                # Network details display
-                with st.expander("📋 Network Details"):
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.write("**DMZ Range:**")
-                        dmz_net = ipaddress.ip_network(dmz_range, strict=False)
-                        st.write(f"- Network: {dmz_net.network_address}")
-                        st.write(f"- Mask: /{dmz_net.prefixlen}")
-                        st.write(f"- Broadcast: {dmz_net.broadcast_address}")
-                        st.write(f"- Hosts: {dmz_net.num_addresses}")
-                    
-                    with col2:
-                        st.write("**Internal Range:**")
-                        int_net = ipaddress.ip_network(internal_range, strict=False)
-                        st.write(f"- Network: {int_net.network_address}")
-                        st.write(f"- Mask: /{int_net.prefixlen}")
-                        st.write(f"- Broadcast: {int_net.broadcast_address}")
-                        st.write(f"- Hosts: {int_net.num_addresses}")
+                st.session_state['dmz_u32'], st.session_state['int_u32'] = mappings
+                st.session_state['mapping_ranges'] = (dmz_range, internal_range)
+                st.session_state['dmz_net'] = dmz_net
+                st.session_state['int_net'] = int_net
+                st.session_state['mapping_page'] = 1
         else:
+            st.session_state.pop('dmz_u32', None)
             st.warning("⚠️ Please fill in both IP ranges")
     
+    # Info message when no generation has been done (outside columns, full width)
+    if 'dmz_u32' not in st.session_state:
+        if not generate_button:
+            st.info("👆 Configure your IP ranges above and click 'Generate Mapping' to start")
+    
+    # Results section (full width)
+    else:
+        dmz_u32 = st.session_state['dmz_u32']
+        int_u32 = st.session_state['int_u32']
+        shown_dmz_range, shown_internal_range = st.session_state['mapping_ranges']
+        
+        # Display statistics
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("📊 Total Mappings", len(dmz_u32))
+        with col2:
+            st.metric("🌐 DMZ Range", shown_dmz_range)
+        with col3:
+            st.metric("🏠 Internal Range", shown_internal_range)
+        
+        st.markdown("---")
+        
+        # Display table
+        st.subheader("✅ 1:1 NAT MAPPING")
+        
+        # Only send one page of rows to the browser
+        pages = max(1, math.ceil(len(dmz_u32) / PAGE_SIZE))
+        if pages > 1:
+            page = st.slider("Page", 1, pages, key='mapping_page')
+        else:
+            page = 1
+        start, stop = (page - 1) * PAGE_SIZE, page * PAGE_SIZE
+        
+        # Streamlit can display a dict of columns directly
+        st.dataframe(
+            {
+                'DMZ_IP': format_slice(dmz_u32, start, stop),
+                'Internal_IP': format_slice(int_u32, start, stop),
+            },
+            width="stretch",
+            hide_index=True
+        )
+        
+        # CSV download button - the file is only built when clicked
+        st.download_button(
+            label="💾 Download as CSV",
+            data=lambda: build_csv(shown_dmz_range, shown_internal_range),
+            file_name="nat_mapping.csv",
+            mime="text/csv",
+            type="secondary"
+        )
+        
+        # Network details display
+        with st.expander("📋 Network Details"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.write("**DMZ Range:**")
+                dmz_net = st.session_state['dmz_net']
+                st.write(f"- Network: {dmz_net.network_address}")
+                st.write(f"- Mask: /{dmz_net.prefixlen}")
+                st.write(f"- Broadcast: {dmz_net.broadcast_address}")
+                st.write(f"- Hosts: {dmz_net.num_addresses}")
+            
+            with col2:
+                st.write("**Internal Range:**")
+                int_net = st.session_state['int_net']
+                st.write(f"- Network: {int_net.network_address}")
+                st.write(f"- Mask: /{int_net.prefixlen}")
+                st.write(f"- Broadcast: {int_net.broadcast_address}")
+                st.write(f"- Hosts: {int_net.num_addresses}")
+    
     # Usage Examples section at the bottom - ALWAYS DISPLAYED
     st.markdown("---")
     st.subheader("📚 Usage Examples")
     
     # Examples in a more compact layout
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        **Small (/30)**
-        - DMZ: 192.168.1.0/30
-        - Internal: 10.0.1.0/30
-        - IPs: 2 addresses
-        """)
+    for col, example in zip(st.columns(3), _EXAMPLES):
+        with col:
+            st.markdown(example)
     
-    with col2:
-        st.markdown("""
-        **Medium (/26)**
-        - DMZ: 192.168.1.0/26
-        - Internal: 10.188.65.0/26
-        - IPs: 62 addresses
-        """)
-    
-    with col3:
-        st.markdown("""
-        **Large (/24)**
-        - DMZ: 192.168.1.0/24
-        - Internal: 10.0.1.0/24
-        - IPs: 254 addresses
-        """)
-        
     # Footer with creator info
     st.markdown("---")
-    st.markdown(
-        """
-        <div style='text-align: center; margin-top: 30px; color: #888;'>
-            <p>🛠️ Built by <strong><a href='https://www.linkedin.com/in/sofiane-kerbel' target='_blank'>Sofiane Kerbel</a></strong></p>
-            <p style='font-size: 12px;'>Network Administration Tool | 1:1 NAT Mapping Generator</p>
-        </div>
-        """, 
-        unsafe_allow_html=True
-    )
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,148 @@
+"""Shared NAT mapping logic used by the Streamlit UI"""
+import streamlit as st
+import csv
+import functools
+import ipaddress
+import io
+import numpy as np
+
+# Numba is optional: when installed, IP formatting runs as native code
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Largest range accepted, to bound memory and CPU per request
+MAX_HOSTS = 65536
+
+# Decimal text of every octet value, so formatting is a table lookup
+_OCT = np.array([str(i) for i in range(256)])
+
+if njit is not None:
+    @njit(nogil=True, cache=True)
+    def _ips_to_bytes(ips, out):
+        """Write each IP as ASCII into its own zero-padded 16-byte slot of out"""
+        for i in range(ips.shape[0]):
+            x = np.int64(ips[i])
+            pos = i * 16
+            for shift in (24, 16, 8, 0):
+                octet = (x >> shift) & 0xff
+                if octet >= 100:
+                    out[pos] = 48 + octet // 100
+                    pos += 1
+                if octet >= 10:
+                    out[pos] = 48 + (octet // 10) % 10
+                    pos += 1
+                out[pos] = 48 + octet % 10
+                pos += 1
+                if shift:
+                    out[pos] = 46
+                    pos += 1
+else:
+    _ips_to_bytes = None
+
+def format_ips(ips):
+    """Format an array of integer IP addresses as strings"""
+    # IPv6 addresses are Python ints in an object array, formatted by ipaddress
+    if ips.dtype == object:
+        return np.array([str(ipaddress.IPv6Address(x)) for x in ips], dtype=str)
+    
+    if _ips_to_bytes is not None:
+        out = np.zeros(len(ips) * 16, dtype=np.uint8)
+        _ips_to_bytes(ips, out)
+        return out.view('S16').astype(str)
+    
+    # Whole-array lookups beat per-address C helpers such as
+    # socket.inet_ntoa, which pays a Python call for every address
+    octets = [_OCT[(ips >> shift) & 0xff] for shift in (24, 16, 8, 0)]
+    
+    result = octets[0]
+    for octet in octets[1:]:
+        result = np.char.add(np.char.add(result, '.'), octet)
+    return result
+
+def format_slice(ips, start, stop):
+    """Format only ips[start:stop] as dotted-quad strings"""
+    return format_ips(ips[start:stop]).tolist()
+
+def format_csv(dmz_u32, int_u32):
+    """Render the full mapping as CSV bytes"""
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator='\n')
+    writer.writerow(('DMZ_IP', 'Internal_IP'))
+    writer.writerows(zip(format_ips(dmz_u32), format_ips(int_u32)))
+    
+    # Keep the original export format: no newline after the last row
+    buf.truncate(buf.tell() - 1)
+    return buf.getvalue().encode()
+
+@functools.lru_cache(maxsize=64)
+def parse_net(net_range):
+    """Parse an IP range once per unique input string"""
+    return ipaddress.ip_network(net_range, strict=False)
+
+@st.cache_data(max_entries=64)
+def generate_nat_mapping(dmz_range, internal_range):
+    """Generate 1:1 NAT mapping between two IP ranges
+    
+    Returns (mappings, dmz_network, internal_network, error) so callers can
+    reuse the parsed networks instead of parsing the ranges again.
+    """
+    # Create networks, stopping at the first range that does not parse
+    try:
+        dmz_network = parse_net(dmz_range)
+    except ValueError as e:
+        return None, None, None, f"❌ ERROR: Invalid DMZ range - {e}"
+    
+    try:
+        internal_network = parse_net(internal_range)
+    except ValueError as e:
+        return None, None, None, f"❌ ERROR: Invalid Internal range - {e}"
+    
+    try:
+        # Check that both ranges use the same IP version
+        if dmz_network.version != internal_network.version:
+            return None, None, None, f"❌ ERROR: IP versions must be identical! DMZ: IPv{dmz_network.version}, Internal: IPv{internal_network.version}"
+        
+        # Check that masks are identical
+        if dmz_network.prefixlen != internal_network.prefixlen:
+            return None, None, None, f"❌ ERROR: Subnet masks must be identical! DMZ: /{dmz_network.prefixlen}, Internal: /{internal_network.prefixlen}"
+        
+        # Refuse ranges that would exhaust the Streamlit process
+        if dmz_network.num_addresses > MAX_HOSTS:
+            max_prefix = dmz_network.max_prefixlen - (MAX_HOSTS.bit_length() - 1)
+            return None, None, None, f"❌ ERROR: Range too large: {dmz_network.num_addresses} hosts. Max {MAX_HOSTS}. Use /{max_prefix} or smaller."
+        
+        # Work on integers rather than IPv4Address objects
+        dmz_start = int(dmz_network.network_address)
+        internal_start = int(internal_network.network_address)
+        count = dmz_network.num_addresses
+        
+        # Match ipaddress hosts(): IPv4 skips the network and broadcast
+        # addresses, IPv6 only the subnet-router anycast (network) address.
+        # Ranges of two addresses or fewer use every address.
+        if count > 2:
+            dmz_start += 1
+            internal_start += 1
+            count -= 2 if dmz_network.version == 4 else 1
+        
+        # Create mapping as two parallel integer arrays, formatted on demand.
+        # IPv6 needs Python ints since addresses do not fit in a NumPy dtype.
+        dtype = np.uint32 if dmz_network.version == 4 else object
+        mappings = (
+            np.arange(dmz_start, dmz_start + count, dtype=dtype),
+            np.arange(internal_start, internal_start + count, dtype=dtype),
+        )
+        
+        return mappings, dmz_network, internal_network, None
+        
+    except Exception as e:
+        return None, None, None, f"❌ ERROR: {e}"
+
+@st.cache_data(max_entries=16)
+def build_csv(dmz_range, internal_range):
+    """Build the CSV export for a pair of ranges, once per unique input"""
+    mappings, _, _, error = generate_nat_mapping(dmz_range, internal_range)
+    if error:
+        raise ValueError(error)
+    return format_csv(*mappings)
@@ -0,0 +1,144 @@
+import ipaddress
+import itertools
+
+import numpy as np
+import pytest
+
+import nat_core
+from nat_core import MAX_HOSTS, build_csv, format_csv, format_slice, generate_nat_mapping
+
+
+def baseline_csv(dmz_range, internal_range):
+    """CSV as produced by the original ipaddress-based implementation"""
+    dmz_network = ipaddress.ip_network(dmz_range, strict=False)
+    internal_network = ipaddress.ip_network(internal_range, strict=False)
+    dmz_ips = list(dmz_network.hosts()) or list(dmz_network)
+    internal_ips = list(internal_network.hosts()) or list(internal_network)
+    csv_lines = ["DMZ_IP,Internal_IP"]
+    for dmz_ip, internal_ip in zip(dmz_ips, internal_ips):
+        csv_lines.append(f"{dmz_ip},{internal_ip}")
+    return "\n".join(csv_lines).encode()
+
+
+# Every octet in every position hits the 1/2/3-digit boundaries
+EDGE_OCTETS = (0, 9, 10, 99, 100, 255)
+EDGE_IPS = np.array(
+    [(a << 24) | (b << 16) | (c << 8) | d for a, b, c, d in itertools.product(EDGE_OCTETS, repeat=4)]
+    + list(range(0, 2**32, 2**32 // 4099)),
+    dtype=np.uint32,
+)
+
+
+def expected_strings(ips):
+    return [str(ipaddress.IPv4Address(int(ip))) for ip in ips]
+
+
+def test_format_ips_numpy_path(monkeypatch):
+    monkeypatch.setattr(nat_core, "_ips_to_bytes", None)
+    assert nat_core.format_ips(EDGE_IPS).tolist() == expected_strings(EDGE_IPS)
+
+
+@pytest.mark.skipif(nat_core._ips_to_bytes is None, reason="numba not installed")
+def test_format_ips_numba_path():
+    result = nat_core.format_ips(EDGE_IPS).tolist()
+    assert result == expected_strings(EDGE_IPS)
+    assert "255.255.255.255" in result
+
+
+def mapping_strings(dmz_range, internal_range):
+    (dmz, internal), _, _, error = generate_nat_mapping(dmz_range, internal_range)
+    assert error is None
+    return format_slice(dmz, 0, len(dmz)), format_slice(internal, 0, len(internal))
+
+
+def test_slash_24_skips_network_and_broadcast():
+    dmz, internal = mapping_strings("192.168.1.0/24", "10.0.1.0/24")
+    assert len(dmz) == len(internal) == 254
+    assert (dmz[0], internal[0]) == ("192.168.1.1", "10.0.1.1")
+    assert (dmz[-1], internal[-1]) == ("192.168.1.254", "10.0.1.254")
+
+
+def test_slash_31_maps_both_addresses():
+    assert mapping_strings("192.168.1.4/31", "10.0.1.0/31") == (
+        ["192.168.1.4", "192.168.1.5"],
+        ["10.0.1.0", "10.0.1.1"],
+    )
+
+
+def test_slash_32_maps_single_address():
+    assert mapping_strings("192.168.1.7/32", "10.0.1.9/32") == (["192.168.1.7"], ["10.0.1.9"])
+
+
+def test_returns_parsed_networks():
+    _, dmz_network, internal_network, error = generate_nat_mapping("192.168.1.0/26", "10.188.65.0/26")
+    assert error is None
+    assert dmz_network == ipaddress.ip_network("192.168.1.0/26")
+    assert internal_network == ipaddress.ip_network("10.188.65.0/26")
+
+
+def test_ipv6_uses_host_path():
+    dmz, internal = mapping_strings("fd00::/120", "fd01::/120")
+    assert len(dmz) == 255
+    assert (dmz[0], internal[-1]) == ("fd00::1", "fd01::ff")
+
+
+def test_ipv6_slash_127_maps_both_addresses():
+    assert mapping_strings("fd00::/127", "fd01::/127") == (["fd00::", "fd00::1"], ["fd01::", "fd01::1"])
+
+
+def test_ipv6_slash_128_maps_single_address():
+    assert mapping_strings("fd00::5/128", "fd01::9/128") == (["fd00::5"], ["fd01::9"])
+
+
+def test_mismatched_prefixes():
+    mappings, _, _, error = generate_nat_mapping("192.168.1.0/24", "10.0.1.0/26")
+    assert mappings is None
+    assert error == "❌ ERROR: Subnet masks must be identical! DMZ: /24, Internal: /26"
+
+
+def test_mismatched_versions():
+    mappings, _, _, error = generate_nat_mapping("192.168.1.0/24", "fd00::/24")
+    assert mappings is None
+    assert error == "❌ ERROR: IP versions must be identical! DMZ: IPv4, Internal: IPv6"
+
+
+def test_max_hosts_rejection():
+    mappings, _, _, error = generate_nat_mapping("10.0.0.0/15", "172.16.0.0/15")
+    assert mappings is None
+    assert error == f"❌ ERROR: Range too large: 131072 hosts. Max {MAX_HOSTS}. Use /16 or smaller."
+    
+    # The limit itself is still accepted
+    mappings, _, _, error = generate_nat_mapping("10.0.0.0/16", "172.16.0.0/16")
+    assert error is None
+    assert len(mappings[0]) == MAX_HOSTS - 2
+
+
+def test_bad_dmz_range():
+    mappings, _, _, error = generate_nat_mapping("junk", "10.0.1.0/24")
+    assert mappings is None
+    assert error.startswith("❌ ERROR: Invalid DMZ range - ")
+
+
+def test_bad_internal_range():
+    mappings, _, _, error = generate_nat_mapping("192.168.1.0/24", "10.0.1.0/33")
+    assert mappings is None
+    assert error.startswith("❌ ERROR: Invalid Internal range - ")
+
+
+@pytest.mark.parametrize("dmz_range, internal_range", [
+    ("192.168.1.0/30", "10.0.1.0/30"),
+    ("192.168.1.0/26", "10.188.65.0/26"),
+    ("192.168.1.4/31", "10.0.1.0/31"),
+    ("192.168.1.7/32", "10.0.1.9/32"),
+    ("10.0.0.0/16", "172.16.0.0/16"),
+    ("fd00::/120", "fd01::/120"),
+    ("fd00::/112", "fd01::/112"),
+    ("fd00::/127", "fd01::/127"),
+    ("fd00::5/128", "fd01::9/128"),
+])
+def test_csv_matches_baseline(dmz_range, internal_range):
+    expected = baseline_csv(dmz_range, internal_range)
+    mappings, _, _, error = generate_nat_mapping(dmz_range, internal_range)
+    assert error is None
+    assert format_csv(*mappings) == expected
+    assert build_csv(dmz_range, internal_range) == expected